@@ -1,21 +1,93 @@
 from fastapi import FastAPI, UploadFile, File, Request
+from typing import Optional
+from collections import OrderedDict
 from .parsing import extract_blocks
+import hashlib
 import os
 import uuid
-from .sentences import split_into_sentences
+from .sentences import split_into_sentences, PREVIEW_SENTENCE_BUDGET
 from .sentences import split_text_into_sentences
 from .summarizer import summarize
 
 app = FastAPI()
 
+# Sentences of already parsed PDFs, keyed by content hash + page/preview options
+# (least recently used dropped first). Extraction and OCR are the expensive part,
+# summarize() is cheap and runs again for every compression_ratio.
+SENTENCE_CACHE_SIZE = 32
+sentence_cache = OrderedDict()
+
+
+def sentence_cache_key(digest, first_page, last_page, max_pages, preview, max_sentences):
+    if preview and max_sentences is None:
+        max_sentences = PREVIEW_SENTENCE_BUDGET
+    return (digest, first_page, last_page, max_pages, preview, max_sentences)
+
+
+def compression_ratio_error(compression_ratio):
+    # Error message for an invalid ratio (None if it is fine)
+    if isinstance(compression_ratio, bool) or not isinstance(compression_ratio, (int, float)):
+        return "compression_ratio must be a number"
+    if not 0 < compression_ratio <= 1:
+        return "compression_ratio must be in (0, 1]"
+    return None
+
+
 @app.get("/")
 def read_root():
     # When the browser hits http://127.0.0.1:8000/, it will receive this dictionary.
     return {"status": "Server running successfully!"}
 
+@app.get("/parse/{digest}")
+async def parse_known(
+    digest: str,
+    first_page: int = 1,
+    last_page: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    preview: bool = False,
+    max_sentences: Optional[int] = None,
+    compression_ratio: float = 0.3,
+):
+    # Lets the client check whether a PDF (SHA-256 of its bytes) was already parsed
+    # with these page/preview options, so it does not have to upload the file again.
+    # Known documents are summarized from the cached sentences with this compression_ratio.
+    # async: runs on the event loop thread like the cache writes in parse_file, so an
+    # entry cannot be evicted between the lookup and move_to_end.
+    error = compression_ratio_error(compression_ratio)
+    if error:
+        return {"error": error}
+
+    key = sentence_cache_key(digest, first_page, last_page, max_pages, preview, max_sentences)
+    data = sentence_cache.get(key)
+    if data is None:
+        return {"known": False}
+
+    sentence_cache.move_to_end(key)
+    summary = summarize(data, compression_ratio=compression_ratio)
+    return {"known": True, "data": summary}
+
+
 # app = FastAPI()
 @app.post("/parse")
-async  def parse_file(file: UploadFile = File(...)):
+async  def parse_file(
+    file: UploadFile = File(...),
+    first_page: int = 1,
+    last_page: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    preview: bool = False,
+    max_sentences: Optional[int] = None,
+    compression_ratio: float = 0.3,
+):
+
+    # first_page / last_page (1-based, inclusive) and max_pages limit which pages are processed.
+    # preview=True skips Pix2Text (formulas become placeholders) and stops after
+    # max_sentences body sentences, headers and formulas not counted (PREVIEW_SENTENCE_BUDGET by default).
+    if preview and max_sentences is None:
+        max_sentences = PREVIEW_SENTENCE_BUDGET
+
+    error = compression_ratio_error(compression_ratio)
+    if error:
+        return {"error": error}
 
     # FastAPI gives the PDF in memory, not as a real file.But our PDF extractor (PyMuPDF) only works with real files on disk.
 
@@ -26,6 +98,14 @@ async  def parse_file(file: UploadFile = File(...)):
 
     try:
         content = await file.read()
+
+        key = sentence_cache_key(hashlib.sha256(content).hexdigest(), first_page, last_page,
+                                 max_pages, preview, max_sentences)
+        cached = sentence_cache.get(key)
+        if cached is not None:
+            sentence_cache.move_to_end(key)
+            return {"data": summarize(cached, compression_ratio=compression_ratio)}
+
         with open(file_path, "wb") as buffer:
             buffer.write(content)
 
@@ -35,13 +115,18 @@ async  def parse_file(file: UploadFile = File(...)):
 
         # 1. Extract the data
         # Note: We use the unpacking doc, pages_data
-        doc, pages_data = extract_blocks(file_path)
+        # pages_data is lazy: pages are loaded while the sentences are processed
+        doc, pages_data = extract_blocks(file_path, first_page, last_page, max_pages)
 
         # 2. Process the sentences
-        data = split_into_sentences(pages_data)
+        data = split_into_sentences(pages_data, preview=preview, max_sentences=max_sentences)
 
         # 3. Clean up and return
-        summary = summarize(data, compression_ratio=0.3)
+        summary = summarize(data, compression_ratio=compression_ratio)
+
+        sentence_cache[key] = data
+        if len(sentence_cache) > SENTENCE_CACHE_SIZE:
+            sentence_cache.popitem(last=False)
         return {"data": summary}
 
     except Exception as e:
@@ -71,9 +156,14 @@ async  def summarize_text(request: Request):
     if not text.strip():
         return {"error": "No text provided"}
 
+    compression_ratio = data.get("compression_ratio", 0.3)
+    error = compression_ratio_error(compression_ratio)
+    if error:
+        return {"error": error}
+
     data = split_text_into_sentences(text)
 
-    summary = summarize(data, compression_ratio=0.3)
+    summary = summarize(data, compression_ratio=compression_ratio)
     return {"data": summary}
 
 
@@ -3,12 +3,48 @@ from statistics import median
 import re
 
 
-def extract_blocks(file_path):
+def page_indices(page_count, first_page=1, last_page=None, max_pages=None):
+
+    """ 0-based indices of the pages to process.
+        first_page / last_page are 1-based and inclusive, max_pages caps the count. """
+
+    if first_page < 1:
+        raise ValueError("first_page must be >= 1")
+    if max_pages is not None and max_pages < 1:
+        raise ValueError("max_pages must be >= 1")
+
+    if first_page > page_count:
+        raise ValueError(f"first_page {first_page} is beyond the last page ({page_count})")
+    if last_page is not None and last_page < first_page:
+        raise ValueError("last_page must not be smaller than first_page")
+
+    last = page_count if last_page is None else min(last_page, page_count)
+
+    indices = range(first_page - 1, last)
+    if max_pages is not None:
+        indices = indices[:max_pages]
+    return indices
+
+
+def extract_blocks(file_path, first_page=1, last_page=None, max_pages=None):
+
+    """ Returns the open document and a lazy iterator over the page data.
+        A page is only loaded when the iterator reaches it, so pages outside
+        the requested range (or after the caller stops) are never loaded. """
 
     doc = fitz.open(file_path)
-    pages = []
+    try:
+        indices = page_indices(len(doc), first_page, last_page, max_pages)
+    except ValueError:
+        doc.close()
+        raise
+
+    return doc, iter_page_blocks(doc, indices, file_path)
+
 
-    for page_number in range(len(doc)):
+def iter_page_blocks(doc, indices, file_path):
+
+    for page_number in indices:
         page = doc.load_page(page_number)
         blocks = page.get_text("dict")["blocks"]
 
@@ -77,7 +113,7 @@ def extract_blocks(file_path):
 
             final_blocks_for_processing.append((stripped_text, size, x0, y0, x1, y1))
 
-        pages.append({
+        yield {
             "page": page_number + 1,
             "blocks": final_blocks_for_processing,
             "body_text_size": body_text_size,
@@ -85,13 +121,6 @@ def extract_blocks(file_path):
             # INSTEAD, add what's needed for rendering (assuming you added this):
             "file_path": file_path,
             "page_index": page_number
-        })
-
-
-    if pages:
-        print(f"DEBUG: extract_blocks returning list of length: {len(pages)}")
-        print(f"DEBUG: Type of first item in pages_data: {type(pages[0])}")
-    # print(f"DEBUG: Returning open document object (ID: {id(doc)}) and page data.")
-    return doc, pages
+        }
 
 
@@ -8,6 +8,9 @@ import sys # Used for checking if P2T initialization failed
 # Output directory where temporary formula images will be saved
 OUTPUT_DIR = "formula_images"
 
+# Used instead of the recognized LaTeX when OCR is skipped (preview mode)
+FORMULA_PLACEHOLDER = "$$ \\text{[formula]} $$"
+
 # --- 1. PIX2TEXT INITIALIZATION (Run once) ---
 try:
     # Initialize the P2T model globally or once per process
@@ -1,12 +1,16 @@
 import spacy
 import re
 import fitz
+from contextlib import nullcontext
 from .heading import detect_heading
-from .pix2text import is_formula_block, render_block_to_image, convert_image_to_LaTeX
+from .pix2text import is_formula_block, render_block_to_image, convert_image_to_LaTeX, FORMULA_PLACEHOLDER
 
 # Load language model once
 nlp = spacy.load("en_core_web_sm")
 
+# Default number of sentences extracted in preview mode before stopping
+PREVIEW_SENTENCE_BUDGET = 60
+
 
 def fix_hyphenation(text):
 
@@ -121,9 +125,18 @@ def split_text_into_sentences(text):
     return data
 
 
-def split_into_sentences(pages):
+def split_into_sentences(pages, preview=False, max_sentences=None):
+
+    """ 'pages' is consumed lazily: once 'max_sentences' is reached the remaining
+        pages are never pulled from the iterator (and so never loaded).
+        Only body sentences count toward 'max_sentences', headers and formulas do not.
+        In preview mode formulas are not rendered/OCRed, they become placeholders. """
+
+    if max_sentences is not None and max_sentences < 1:
+        raise ValueError("max_sentences must be >= 1")
 
     data = []
+    sentence_count = 0   # body sentences in 'data' (headers/formulas excluded)
     for page in pages:
 
         page_number = page["page"]
@@ -135,18 +148,23 @@ def split_into_sentences(pages):
         page_idx = page.get("page_index")
 
         page_data = []   # collecting sentences for the current page
+        page_sentence_count = 0
         previousBlock_y1 = None
         nextBlock_y0 = None
         current_header = None
         math_block_index = 0
 
-        # Open the document briefly for this page's OCR
-        with fitz.open(file_path) as tmp_doc:
-            page_object = tmp_doc.load_page(page_idx)
+        # Open the document briefly for this page's OCR (not needed in preview mode)
+        with (nullcontext() if preview else fitz.open(file_path)) as tmp_doc:
+            page_object = tmp_doc.load_page(page_idx) if tmp_doc is not None else None
 
             blocks = page["blocks"]
             for i, (block_text, block_font_size, x0, y0, x1, y1) in enumerate(blocks):
 
+                # Stop early, the budget is already filled by this page
+                if max_sentences is not None and sentence_count + page_sentence_count >= max_sentences:
+                    break
+
                 block_coords = (x0, y0, x1, y1)
                 # HEADER DETECTION
 
@@ -176,6 +194,15 @@ def split_into_sentences(pages):
 
                 if is_formula_block(block_text, block_font_size, body_text_size):
 
+                        if preview:
+                            page_data.append({
+                                "sentence": FORMULA_PLACEHOLDER,
+                                "header": current_header,
+                                "is_formula": True,
+                            })
+                            previousBlock_y1 = y1
+                            continue
+
                         # Render the block to an image file
                         image_path = render_block_to_image(page_object, block_coords, page_number, math_block_index)
                         # Convert image to LaTeX using Pix2Text
@@ -238,6 +265,7 @@ def split_into_sentences(pages):
                                 "is_header": False,
                                 "is_formula": False
                             })
+                            page_sentence_count += 1
                     previousBlock_y1 = y1
 
                 except:
@@ -247,5 +275,21 @@ def split_into_sentences(pages):
             repaired_data = repair_data(page_data, page_number)
             # Adding the repaired sentences to the final output list
             data.extend(repaired_data)
+            # repair_data tags headers and formulas with a "type"
+            sentence_count += sum(1 for s in repaired_data if "type" not in s)
+
+        # Budget reached: do not pull (load) the next page
+        if max_sentences is not None and sentence_count >= max_sentences:
+            break
+
+    # Cut right after the max_sentences-th body sentence
+    if max_sentences is not None and sentence_count > max_sentences:
+        kept = 0
+        for end, s in enumerate(data):
+            if "type" not in s:
+                kept += 1
+                if kept == max_sentences:
+                    data = data[:end + 1]
+                    break
 
     return data
@@ -0,0 +1,145 @@
+""" Counts HTTP round-trips and transferred bytes for repeated PDF submissions.
+
+    Run from the repository root:
+        python -m benchmarks.frontend_roundtrips
+
+    The Streamlit request flow (frontend/app.py: summarize_pdf) is pointed at the
+    FastAPI app through an in-process TestClient, mounted on the requests.Session
+    with a counting adapter. Sentence splitting and summarization are replaced by
+    cheap fakes: only the HTTP traffic is measured here. """
+
+from urllib.parse import urlsplit
+
+import fitz
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from fastapi.testclient import TestClient
+
+import backend.api as api
+import frontend.app as ui
+
+
+class CountingAdapter(BaseAdapter):
+
+    """ Sends requests to the FastAPI TestClient and records every round-trip. """
+
+    def __init__(self, client):
+        super().__init__()
+        self.client = client
+        self.calls = []   # (method, path, bytes sent, bytes received)
+
+    def send(self, request, **kwargs):
+        url = urlsplit(request.url)
+        path = url.path + (f"?{url.query}" if url.query else "")
+        body = request.body or b""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        response = self.client.request(request.method, path, content=body, headers=dict(request.headers))
+
+        self.calls.append((request.method, url.path, len(body), len(response.content)))
+
+        result = requests.Response()
+        result.status_code = response.status_code
+        result._content = response.content
+        result.headers = CaseInsensitiveDict(response.headers)
+        result.encoding = "utf-8"
+        result.url = request.url
+        result.request = request
+        return result
+
+    def close(self):
+        pass
+
+    def count(self, method):
+        return sum(1 for call in self.calls if call[0] == method)
+
+    def bytes_sent(self):
+        return sum(call[2] for call in self.calls)
+
+    def bytes_received(self):
+        return sum(call[3] for call in self.calls)
+
+
+def build_pdf(page_count=5):
+    doc = fitz.open()
+    for page_number in range(page_count):
+        page = doc.new_page()
+        page.insert_text((72, 80), f"Section {page_number + 1}: a page of the paper under test.", fontsize=11)
+    content = doc.tobytes()
+    doc.close()
+    return content
+
+
+def fake_split_into_sentences(pages, preview=False, max_sentences=None):
+    return [{"sentence": f"Sentence of page {page['page']}.", "header": None, "page": page["page"]}
+            for page in pages]
+
+
+def fake_summarize(data, compression_ratio=0.3):
+    return data[:max(1, int(len(data) * compression_ratio))]
+
+
+def submit(adapter, digest, ratio, content):
+
+    """ One Submit click; returns the round-trips it caused. """
+
+    before = len(adapter.calls)
+    ui.summarize_pdf(digest, ratio, content, "paper.pdf")
+    calls = adapter.calls[before:]
+    return {
+        "GET": sum(1 for c in calls if c[0] == "GET"),
+        "POST": sum(1 for c in calls if c[0] == "POST"),
+        "sent": sum(c[2] for c in calls),
+        "received": sum(c[3] for c in calls),
+    }
+
+
+def main():
+
+    api.split_into_sentences = fake_split_into_sentences
+    api.summarize = fake_summarize
+    api.sentence_cache.clear()
+
+    adapter = CountingAdapter(TestClient(api.app))
+    session = requests.Session()
+    session.mount(ui.API_URL, adapter)
+    ui.get_session = lambda: session
+    ui.summarize_pdf.clear()
+
+    content = build_pdf()
+    digest = ui.content_hash(content)
+    ratio = 0.3
+
+    # 1. New document: backend lookup misses, the PDF is uploaded once
+    first = submit(adapter, digest, ratio, content)
+    assert first["GET"] == 1 and first["POST"] == 1, first
+    assert first["sent"] >= len(content), first
+
+    # 2. Same bytes, fresh UI cache (e.g. another user session): lookup hits, no upload
+    ui.summarize_pdf.clear()
+    second = submit(adapter, digest, ratio, content)
+    assert second["GET"] == 1 and second["POST"] == 0, second
+    assert second["sent"] == 0, second
+
+    # 3. Same bytes and ratio again: served by st.cache_data, no request at all
+    third = submit(adapter, digest, ratio, content)
+    assert third["GET"] == 0 and third["POST"] == 0, third
+
+    # 4. Other ratio: a new summary from the sentences the backend already has, no upload
+    other = submit(adapter, digest, 0.5, content)
+    assert other["GET"] == 1 and other["POST"] == 0, other
+    assert other["sent"] == 0, other
+
+    print(f"PDF size: {len(content)} bytes")
+    print(f"{'submission':<32}{'GET':>5}{'POST':>6}{'sent B':>10}{'received B':>12}")
+    for name, stats in [("1 new document", first), ("2 same bytes, UI cache cleared", second),
+                        ("3 same bytes, UI cache", third), ("4 same bytes, ratio 0.5", other)]:
+        print(f"{name:<32}{stats['GET']:>5}{stats['POST']:>6}{stats['sent']:>10}{stats['received']:>12}")
+    print(f"total: {adapter.count('GET')} GET, {adapter.count('POST')} POST, "
+          f"{adapter.bytes_sent()} B sent, {adapter.bytes_received()} B received")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+""" Preview vs full latency of the /parse pipeline on a long PDF.
+
+    Run from the repository root:
+        python -m benchmarks.preview_latency [--pages 60] [--repeat 3] [--pdf paper.pdf]
+
+    Times extract_blocks + split_into_sentences for full mode, preview mode and
+    page-limited modes, and counts how many pages the lazy page iterator actually
+    yielded (i.e. how many pages were loaded). Formula images rendered in full mode
+    go to a temporary directory, the working tree is not touched. """
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+import fitz
+
+import backend.pix2text as pix2text
+from backend.parsing import extract_blocks
+from backend.sentences import split_into_sentences, PREVIEW_SENTENCE_BUDGET
+
+
+PARAGRAPH = (
+    "We study the problem of summarizing long scientific papers with an extractive method. "
+    "The approach scores every sentence with TF-IDF weights and keeps the most important ones. "
+    "Sentences are kept in their original order so that the summary stays readable for the user. "
+    "Headers and formulas are detected from the layout of the page before the text is split."
+)
+
+
+def build_pdf(path, page_count):
+
+    """ Writes a synthetic paper: one heading, a few paragraphs and a formula per page. """
+
+    doc = fitz.open()
+    for page_number in range(page_count):
+        page = doc.new_page()
+        page.insert_text((72, 80), f"{page_number + 1} Section {page_number + 1}", fontsize=14)
+
+        y = 110
+        for _ in range(4):
+            page.insert_textbox(fitz.Rect(72, y, 540, y + 110), PARAGRAPH, fontsize=10)
+            y += 120
+
+        page.insert_text((200, y + 20), "E = m * c^2 + (x - y) / z (1)", fontsize=10)
+    doc.save(path)
+    doc.close()
+
+
+class CountingPages:
+
+    """ Wraps the lazy page iterator and counts the pages it yields. """
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.count = 0
+
+    def __iter__(self):
+        for page in self.pages:
+            self.count += 1
+            yield page
+
+
+def run_once(file_path, preview=False, max_sentences=None, **page_options):
+
+    start = time.perf_counter()
+    doc, pages_data = extract_blocks(file_path, **page_options)
+    try:
+        counted = CountingPages(pages_data)
+        data = split_into_sentences(counted, preview=preview, max_sentences=max_sentences)
+    finally:
+        doc.close()
+    elapsed = time.perf_counter() - start
+
+    return elapsed, counted.count, len(data)
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=60, help="pages of the generated PDF")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per mode")
+    parser.add_argument("--pdf", help="use this PDF instead of a generated one")
+    args = parser.parse_args()
+
+    modes = [
+        ("full", {}),
+        ("preview", {"preview": True, "max_sentences": PREVIEW_SENTENCE_BUDGET}),
+        ("max_pages=5", {"max_pages": 5}),
+        ("preview, max_pages=5", {"preview": True, "max_sentences": PREVIEW_SENTENCE_BUDGET, "max_pages": 5}),
+        ("pages 10-12", {"first_page": 10, "last_page": 12}),
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Full mode renders formulas into OUTPUT_DIR and deletes them afterwards:
+        # keep that away from the tracked formula_images/ directory
+        output_dir = pix2text.OUTPUT_DIR
+        pix2text.OUTPUT_DIR = os.path.join(tmp_dir, "formula_images")
+
+        file_path = args.pdf
+        if file_path is None:
+            file_path = os.path.join(tmp_dir, "long_paper.pdf")
+            build_pdf(file_path, args.pages)
+
+        with fitz.open(file_path) as doc:
+            total_pages = len(doc)
+        print(f"PDF: {file_path} ({total_pages} pages), {args.repeat} runs per mode\n")
+
+        rows = []
+        for name, options in modes:
+            timings = []
+            try:
+                for _ in range(args.repeat):
+                    elapsed, pages_loaded, sentences = run_once(file_path, **options)
+                    timings.append(elapsed)
+            except ValueError as e:
+                # e.g. a page range outside a short --pdf
+                print(f"skipping {name}: {e}")
+                continue
+            rows.append((name, statistics.median(timings), min(timings), pages_loaded, sentences))
+
+        pix2text.OUTPUT_DIR = output_dir
+
+    print(f"{'mode':<24}{'median s':>10}{'best s':>10}{'pages loaded':>14}{'sentences':>11}")
+    for name, median_s, best_s, pages_loaded, sentences in rows:
+        print(f"{name:<24}{median_s:>10.3f}{best_s:>10.3f}{pages_loaded:>14}{sentences:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,73 +1,125 @@
 # UI LAYER
 import streamlit as st
 import requests
+import hashlib
 
-# Input paragraph & Layout
-st.title("Summarizer App")
-st.write("Enter your paragraph below to summarize:")
+API_URL = "http://127.0.0.1:8000"
 
-userInput = st.text_area( "Paste your text here", height=220, placeholder=". . . . . . ." )
-uploaded_file = st.file_uploader("Upload a paper", type="pdf")
+# st.cache_data is shared by all users: keep at most this many rendered summaries
+# (same size as the backend's SENTENCE_CACHE_SIZE)
+SUMMARY_CACHE_SIZE = 32
 
-summary  = []
 
-if st.button("Submit"):
-    try:
-        with st.spinner("Processing…"):
-            response = None
+def get_session():
+    # One pooled HTTP session per user session, reused across reruns.
+    # Kept in session_state (not st.cache_resource) so concurrent users never share it.
+    if "http_session" not in st.session_state:
+        st.session_state.http_session = requests.Session()
+    return st.session_state.http_session
 
-        # Send PDF to FastAPI
-        if uploaded_file is not None:
 
-            response = requests.post(
-                "http://127.0.0.1:8000/parse",
-                files={"file": uploaded_file}
-            )
-            summary  = response.json().get("data", [])
+def content_hash(content):
+    return hashlib.sha256(content).hexdigest()
 
-        # Send text to FastAPI
-        elif userInput.strip():
 
-            response = requests.post(
-                "http://127.0.0.1:8000/Summarize_text",
-                json={"text": userInput}
-            )
-            summary = response.json().get("data", [])
-        else:
-            st.warning("Please upload a PDF or enter text")
+def render_summary(result):
 
-    except Exception as e:
-        st.error(f"Error: {e}")
+    """ Groups the summary sentences by header and builds the text shown in the UI. """
+
+    if "error" in result:
+        # Raising (instead of returning) keeps failed requests out of st.cache_data
+        raise RuntimeError(result["error"])
+
+    summary = result.get("data", [])
 
     # group sentences by header
     sections = {}
-    if summary:
+    for s in summary:
+        header = s["header"]
 
-        for s in summary:
-            header = s["header"]
+        # replace None header
+        if header is None:
+            header = ""
 
-            # replace None header
-            if header is None:
-                header = ""
+        if header not in sections:
+            sections[header] = []
 
-            if header not in sections:
-                sections[header] = []
+        sections[header].append({
+            "sentence": s["sentence"],
+            "page": s["page"]
+        })
 
-            sections[header].append({
-                "sentence": s["sentence"],
-                "page": s["page"]
-            })
 
+    summary_text = ""
+    for header, sec in sections.items():
 
-        summary_text = ""
-        for header, sec in sections.items():
+        sentences = (s["sentence"] for s in sec)
+        pages = sec[-1]["page"]
 
-            sentences = (s["sentence"] for s in sec)
-            pages = sec[-1]["page"]
+        summary_text += f"\n{header}\n{[s for s in sentences]} (p.{pages})\n"
 
-            summary_text += f"\n{header}\n{[s for s in sentences]} (p.{pages})\n"
+    return summary_text
 
-        st.text_area("Full Summary", value=summary_text, height=400)
 
+# Arguments starting with "_" are not hashed by st.cache_data:
+# the cache is keyed by the content hash and the ratio only.
+@st.cache_data(show_spinner=False, max_entries=SUMMARY_CACHE_SIZE)
+def summarize_pdf(digest, ratio, _content, _filename):
+
+    session = get_session()
+    params = {"compression_ratio": ratio}
+
+    # Ask the backend first, the PDF is only uploaded if it has not seen it yet
+    result = session.get(f"{API_URL}/parse/{digest}", params=params).json()
+    if not result.get("known"):
+        result = session.post(
+            f"{API_URL}/parse",
+            params=params,
+            files={"file": (_filename, _content, "application/pdf")}
+        ).json()
 
+    return render_summary(result)
 
+
+@st.cache_data(show_spinner=False, max_entries=SUMMARY_CACHE_SIZE)
+def summarize_text(digest, ratio, _text):
+
+    response = get_session().post(
+        f"{API_URL}/Summarize_text",
+        json={"text": _text, "compression_ratio": ratio}
+    )
+    return render_summary(response.json())
+
+
+# Input paragraph & Layout
+st.title("Summarizer App")
+st.write("Enter your paragraph below to summarize:")
+
+userInput = st.text_area( "Paste your text here", height=220, placeholder=". . . . . . ." )
+uploaded_file = st.file_uploader("Upload a paper", type="pdf")
+ratio = st.slider("Summary length (share of sentences kept)", 0.1, 0.9, 0.3, 0.05)
+
+summary_text = ""
+
+if st.button("Submit"):
+    try:
+        with st.spinner("Processing…"):
+
+            # Send PDF to FastAPI
+            if uploaded_file is not None:
+
+                content = uploaded_file.getvalue()
+                summary_text = summarize_pdf(content_hash(content), ratio, content, uploaded_file.name)
+
+            # Send text to FastAPI
+            elif userInput.strip():
+
+                summary_text = summarize_text(content_hash(userInput.encode("utf-8")), ratio, userInput)
+            else:
+                st.warning("Please upload a PDF or enter text")
+
+    except Exception as e:
+        st.error(f"Error: {e}")
+
+    if summary_text:
+        st.text_area("Full Summary", value=summary_text, height=400)